@@ -31,7 +31,7 @@ from elf_diff.binary_file_format import determineBinaryFileFormat
 from elf_diff.symbol_extractor import SymbolExtractor
 
 import os
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Pattern
 
 
 class Binary(object):
@@ -39,8 +39,8 @@ class Binary(object):
         self,
         settings: Settings,
         filename: str,
-        symbol_selection_regex: Optional[str] = None,
-        symbol_exclusion_regex: Optional[str] = None,
+        symbol_selection_regex: Optional[Pattern[str]] = None,
+        symbol_exclusion_regex: Optional[Pattern[str]] = None,
         mangling: Optional[Mangling] = None,
         source_prefix: Optional[List[str]] = None,
     ):
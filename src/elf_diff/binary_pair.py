@@ -92,8 +92,8 @@ class BinaryPair(object):
         self.old_binary = Binary(
             self.settings,
             self.pair_settings.old_binary_filename,
-            symbol_selection_regex_old,
-            symbol_exclusion_regex_old,
+            self.settings.symbol_selection_regex_old_compiled,
+            self.settings.symbol_exclusion_regex_old_compiled,
             mangling=Mangling(settings.old_mangling_file),
             source_prefix=settings.old_source_prefix or settings.source_prefix,
         )
@@ -103,8 +103,8 @@ class BinaryPair(object):
         self.new_binary = Binary(
             self.settings,
             self.pair_settings.new_binary_filename,
-            symbol_selection_regex_new,
-            symbol_exclusion_regex_new,
+            self.settings.symbol_selection_regex_new_compiled,
+            self.settings.symbol_exclusion_regex_new_compiled,
             mangling=Mangling(settings.new_mangling_file),
             source_prefix=settings.new_source_prefix or settings.source_prefix,
         )
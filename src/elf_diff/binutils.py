@@ -20,10 +20,43 @@
 #
 from elf_diff.error_handling import warning
 
-from typing import List, Optional, Dict
+from typing import Optional, Dict, Tuple
+import functools
 import os
 import shutil
 
+# Executable file extensions in the order they are tried
+EXE_EXTENSIONS: Tuple[str, ...] = (".exe", "") if os.name == "nt" else ("", ".exe")
+
+
+@functools.lru_cache(maxsize=None)
+def _findExecutables(directory: str, basenames: Tuple[str, ...]) -> Dict[str, str]:
+    """Scan a directory once and map basenames to the executables found in it
+
+    Scanning stops as soon as all basenames are found.
+    """
+    wanted = {os.path.normcase(basename) for basename in basenames}
+    executables: Dict[str, str] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name: str = os.path.normcase(entry.name)
+                if name not in wanted:
+                    continue
+                if entry.is_file() and os.access(entry.path, os.X_OK):
+                    executables[name] = entry.path
+                    if len(executables) == len(wanted):
+                        break
+    except OSError:
+        pass
+    return executables
+
+
+@functools.lru_cache(maxsize=None)
+def _which(basename: str, path: str) -> Optional[str]:
+    """Memoized shutil.which, keyed by the PATH it searches"""
+    return shutil.which(basename, path=path)
+
 
 class Binutils(object):
     COMMANDS = ["objdump", "nm", "readelf", "size"]
@@ -37,24 +70,38 @@ class Binutils(object):
         self._bin_prefix: str = ""
         self.is_functional = True
 
-    def _findUtilityInBinDir(
-        self, name: str, exe_extensions: List[str]
-    ) -> Optional[str]:
-        for exe_extension in exe_extensions:
-            basename: str = self._bin_prefix + name + exe_extension
+    def _findUtilityInBinDir(self, name: str) -> Optional[str]:
+        if self._bin_dir is None:
+            return None
+
+        exe_extensions: Tuple[str, ...] = EXE_EXTENSIONS
+        # Entries of bin_dir can never match a prefix with a directory part
+        if not os.path.dirname(self._bin_prefix):
+            # Look up all utilities at once to scan bin_dir only a single time
+            basenames: Tuple[str, ...] = tuple(
+                self._bin_prefix + command + EXE_EXTENSIONS[0]
+                for command in Binutils.COMMANDS
+            )
+            basename: str = self._bin_prefix + name + EXE_EXTENSIONS[0]
+            command = _findExecutables(self._bin_dir, basenames).get(
+                os.path.normcase(basename)
+            )
+            if command is not None:
+                return command
+            exe_extensions = EXE_EXTENSIONS[1:]
 
-            if self._bin_dir is not None:
-                command = os.path.join(self._bin_dir, basename)
-                if (os.path.isfile(command)) and (os.access(command, os.X_OK)):
-                    return command
+        for exe_extension in exe_extensions:
+            command = os.path.join(
+                self._bin_dir, self._bin_prefix + name + exe_extension
+            )
+            if (os.path.isfile(command)) and (os.access(command, os.X_OK)):
+                return command
         return None
 
-    def _findUtilityUsingWhich(
-        self, name: str, exe_extensions: List[str]
-    ) -> Optional[str]:
-        for exe_extension in exe_extensions:
-            basename = self._bin_prefix + name + exe_extension
-            command = shutil.which(basename)
+    def _findUtilityInPath(self, name: str) -> Optional[str]:
+        path: str = os.environ.get("PATH", os.defpath)
+        for exe_extension in EXE_EXTENSIONS:
+            command = _which(self._bin_prefix + name + exe_extension, path)
             if (
                 (command is not None)
                 and (os.path.isfile(command))
@@ -72,19 +119,13 @@ class Binutils(object):
                 return
             warning(f"Unable to find predefined {command_name} = {command}")
 
-        exe_extensions: List[str]
-        if os.name == "nt":
-            exe_extensions = [".exe", ""]
-        else:
-            exe_extensions = ["", ".exe"]
-
-        command = self._findUtilityInBinDir(name, exe_extensions)
+        command = self._findUtilityInBinDir(name)
 
         if command is not None:
             setattr(self, command_name, command)
             return
 
-        command = self._findUtilityUsingWhich(name, exe_extensions)
+        command = self._findUtilityInPath(name)
 
         if command is not None:
             setattr(self, command_name, command)
@@ -100,7 +141,7 @@ class Binutils(object):
         self._bin_dir = bin_dir
 
         for command in Binutils.COMMANDS:
-            attr_name = "%s_command" % command
+            attr_name = f"{command}_command"
             setattr(self, attr_name, associate.get(attr_name, None))
 
         self.findUtility("objdump")
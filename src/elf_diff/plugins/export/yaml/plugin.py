@@ -31,7 +31,6 @@ from elf_diff.document_explorer import (
 )
 from elf_diff.settings import Settings
 from elf_diff.pair_report_document import ValueTreeNode
-import yaml
 from typing import Dict
 
 
@@ -43,6 +42,8 @@ class YAMLExportPairReportPlugin(ExportPairReportPlugin):
 
     def export(self, document: ValueTreeNode) -> None:
         """Export the elf_diff document as YAML"""
+        import yaml
+
         generator_options = GeneratorOptions(enforce_names_alpha=False)
         dict_: dict = generateDictionary(
             document,
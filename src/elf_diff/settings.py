@@ -24,13 +24,28 @@ from elf_diff.binutils import Binutils
 
 import sys
 import os
+import re
 import argparse
-import yaml
-import datetime
-from typing import Optional, Union, List, Dict, Any
+import functools
+import json
+import stat
+import uuid
+from typing import Optional, Union, List, Dict, Tuple, Pattern, Any
 
 
 class Parameter(object):
+    __slots__ = (
+        "name",
+        "description",
+        "default",
+        "alias",
+        "deprecated_alias",
+        "no_cmd_line",
+        "is_flag",
+        "action",
+        "no_member",
+    )
+
     def __init__(
         self,
         name: str,
@@ -55,213 +70,242 @@ class Parameter(object):
         self.no_member = no_member
 
 
-GROUPED_PARAMETERS: Dict[str, List[Parameter]] = {
-    "Binaries": [
-        Parameter("old_binary_filename", "The old version of the elf binary."),
-        Parameter("new_binary_filename", "The new version of the elf binary."),
-        Parameter(
-            "language",
-            "A hint about the language that the elf was compiled from (choices: c++).",
-            default="c++",
-        ),
-        Parameter(
-            "source_prefix",
-            "A path prefix to remove from old and new source files (overridden by [old|new]_source_prefix)",
-            action="append",
-        ),
-        Parameter(
-            "old_source_prefix",
-            "A path prefix to remove from old source files",
-            action="append",
-        ),
-        Parameter(
-            "new_source_prefix",
-            "A path prefix to remove from new source files",
-            action="append",
-        ),
-    ],
-    "Report Content": [
-        Parameter("project_title", "A project title to use for all reports."),
-        Parameter(
-            "old_alias",
-            "An alias string that is supposed to be used to reference the old binary version.",
-        ),
-        Parameter(
-            "new_alias",
-            "An alias string that is supposed to be used to reference the new binary version.",
-        ),
-        Parameter(
-            "old_info_file",
-            "A text file that contains information about the old binary version.",
-        ),
-        Parameter(
-            "new_info_file",
-            "A text file that contains information about the new binary version.",
-        ),
-        Parameter(
-            "build_info",
-            "A string that contains build information that is to be added to the report.",
-            default="",
-        ),
-        Parameter(
-            "similarity_threshold",
-            "A threshold value between 0 and 1 above which two compared symbols are considered being similar",
-            default=0.5,
-        ),
-        Parameter(
-            "skip_symbol_similarities",
-            "If this flag is provided, symbol similarities (which are quite expensive to determine) are skipped",
-            default=False,
-            is_flag=True,
-        ),
-        Parameter(
-            "skip_persisting_same_size",
-            "If this flag is provided, persisting symbols without size changes are skipped",
-            default=False,
-            is_flag=True,
-        ),
-        Parameter(
-            "consider_equal_sized_identical",
-            "If this flag is defined, symbols of equal size are considered as identical (and thus ignored in most cases).",
-            default=False,
-            is_flag=True,
-        ),
-        Parameter(
-            "skip_details",
-            "If this flag is defined, report details are displayed",
-            default=False,
-            is_flag=True,
-        ),
-    ],
-    "Binutils": [
-        Parameter(
-            "bin_dir",
-            "A place where the binutils live.",
-            default=None,
-        ),
-        Parameter(
-            "bin_prefix",
-            "A prefix that is added to binutils executables.",
-            default="",
-        ),
-        Parameter(
-            "objdump_command",
-            "Full path to the objdump untility.",
-            default=None,
-            no_member=True,
-        ),
-        Parameter(
-            "nm_command", "Full path to the nm untility.", default=None, no_member=True
-        ),
-        Parameter(
-            "readelf_command",
-            "Full path to the readelf untility.",
-            default=None,
-            no_member=True,
-        ),
-        Parameter(
-            "size_command",
-            "Full path to the size untility.",
-            default=None,
-            no_member=True,
-        ),
-    ],
-    "Mangling": [
-        Parameter(
-            "old_mangling_file",
-            "Full path to a mangling file for old elf.",
-            default=None,
-        ),
-        Parameter(
-            "new_mangling_file",
-            "Full path to a mangling file for new elf.",
-            default=None,
-        ),
-    ],
-    "Output": [
-        Parameter(
-            "html_file", "The filename of the generated single page HTML report."
+GROUPED_PARAMETERS: Tuple[Tuple[str, Tuple[Parameter, ...]], ...] = (
+    (
+        "Binaries",
+        (
+            Parameter("old_binary_filename", "The old version of the elf binary."),
+            Parameter("new_binary_filename", "The new version of the elf binary."),
+            Parameter(
+                "language",
+                "A hint about the language that the elf was compiled from (choices: c++).",
+                default="c++",
+            ),
+            Parameter(
+                "source_prefix",
+                "A path prefix to remove from old and new source files (overridden by [old|new]_source_prefix)",
+                action="append",
+            ),
+            Parameter(
+                "old_source_prefix",
+                "A path prefix to remove from old source files",
+                action="append",
+            ),
+            Parameter(
+                "new_source_prefix",
+                "A path prefix to remove from new source files",
+                action="append",
+            ),
         ),
-        Parameter("html_dir", "The directory of the generated multi page HTML report."),
-        Parameter("pdf_file", "The filename of the generated PDF report."),
-        Parameter("yaml_file", "The filename of the generated YAML report."),
-        Parameter("json_file", "The filename of the generated JSON report."),
-        Parameter("txt_file", "The filename of the generated text based report."),
-        Parameter("xml_file", "The filename of the generated XML report."),
-        Parameter(
-            "dump_document_structure",
-            "If this flag is provided, the elf_diff document structure is written to stdout",
-            default=False,
-            is_flag=True,
-        ),
-        Parameter(
-            "mass_report",
-            "Forces a mass report being generated. Otherwise the decision whether to generate a mass report is based on the binary_pairs found in the driver file.",
-            default=False,
-            is_flag=True,
-        ),
-    ],
-    "Symbol Selection": [
-        Parameter(
-            "symbol_selection_regex",
-            "A regex that is applied to select symbols to be considered for both, the old and the new elf file",
-            default=None,
-        ),
-        Parameter(
-            "symbol_selection_regex_old",
-            "A regex that is applied to select symbols to be considered for the old elf file",
-            default=None,
-        ),
-        Parameter(
-            "symbol_selection_regex_new",
-            "A regex that is applied to select symbols to be considered for the new elf file",
-            default=None,
-        ),
-        Parameter(
-            "symbol_exclusion_regex",
-            "A regex that is applied to select symbols to be excluded for both, the old and the new elf file",
-            default=None,
-        ),
-        Parameter(
-            "symbol_exclusion_regex_old",
-            "A regex that is applied to select symbols to be excluded for the old elf file",
-            default=None,
+    ),
+    (
+        "Report Content",
+        (
+            Parameter("project_title", "A project title to use for all reports."),
+            Parameter(
+                "old_alias",
+                "An alias string that is supposed to be used to reference the old binary version.",
+            ),
+            Parameter(
+                "new_alias",
+                "An alias string that is supposed to be used to reference the new binary version.",
+            ),
+            Parameter(
+                "old_info_file",
+                "A text file that contains information about the old binary version.",
+            ),
+            Parameter(
+                "new_info_file",
+                "A text file that contains information about the new binary version.",
+            ),
+            Parameter(
+                "build_info",
+                "A string that contains build information that is to be added to the report.",
+                default="",
+            ),
+            Parameter(
+                "similarity_threshold",
+                "A threshold value between 0 and 1 above which two compared symbols are considered being similar",
+                default=0.5,
+            ),
+            Parameter(
+                "skip_symbol_similarities",
+                "If this flag is provided, symbol similarities (which are quite expensive to determine) are skipped",
+                default=False,
+                is_flag=True,
+            ),
+            Parameter(
+                "skip_persisting_same_size",
+                "If this flag is provided, persisting symbols without size changes are skipped",
+                default=False,
+                is_flag=True,
+            ),
+            Parameter(
+                "consider_equal_sized_identical",
+                "If this flag is defined, symbols of equal size are considered as identical (and thus ignored in most cases).",
+                default=False,
+                is_flag=True,
+            ),
+            Parameter(
+                "skip_details",
+                "If this flag is defined, report details are displayed",
+                default=False,
+                is_flag=True,
+            ),
         ),
-        Parameter(
-            "symbol_exclusion_regex_new",
-            "A regex that is applied to select symbols to be excluded for the new elf file",
-            default=None,
+    ),
+    (
+        "Binutils",
+        (
+            Parameter(
+                "bin_dir",
+                "A place where the binutils live.",
+                default=None,
+            ),
+            Parameter(
+                "bin_prefix",
+                "A prefix that is added to binutils executables.",
+                default="",
+            ),
+            Parameter(
+                "objdump_command",
+                "Full path to the objdump untility.",
+                default=None,
+                no_member=True,
+            ),
+            Parameter(
+                "nm_command",
+                "Full path to the nm untility.",
+                default=None,
+                no_member=True,
+            ),
+            Parameter(
+                "readelf_command",
+                "Full path to the readelf untility.",
+                default=None,
+                no_member=True,
+            ),
+            Parameter(
+                "size_command",
+                "Full path to the size untility.",
+                default=None,
+                no_member=True,
+            ),
         ),
-    ],
-    "Plugins": [
-        Parameter(
-            "load_plugin",
-            'Loads and parametrizes a plugin. Example: --load_plugin "some/path/to/module.py;PluginClass;foo1=bar2;foo2=bar2"',
-            action="append",
+    ),
+    (
+        "Mangling",
+        (
+            Parameter(
+                "old_mangling_file",
+                "Full path to a mangling file for old elf.",
+                default=None,
+            ),
+            Parameter(
+                "new_mangling_file",
+                "Full path to a mangling file for new elf.",
+                default=None,
+            ),
         ),
-        Parameter(
-            "load_default_plugin",
-            'Loads and parametrizes a default plugin. Example --load_default_plugin "html_export;single_page=False;template_dir=some_directory"',
-            action="append",
+    ),
+    (
+        "Output",
+        (
+            Parameter(
+                "html_file", "The filename of the generated single page HTML report."
+            ),
+            Parameter(
+                "html_dir", "The directory of the generated multi page HTML report."
+            ),
+            Parameter("pdf_file", "The filename of the generated PDF report."),
+            Parameter("yaml_file", "The filename of the generated YAML report."),
+            Parameter("json_file", "The filename of the generated JSON report."),
+            Parameter("txt_file", "The filename of the generated text based report."),
+            Parameter("xml_file", "The filename of the generated XML report."),
+            Parameter(
+                "dump_document_structure",
+                "If this flag is provided, the elf_diff document structure is written to stdout",
+                default=False,
+                is_flag=True,
+            ),
+            Parameter(
+                "mass_report",
+                "Forces a mass report being generated. Otherwise the decision whether to generate a mass report is based on the binary_pairs found in the driver file.",
+                default=False,
+                is_flag=True,
+            ),
         ),
-        Parameter(
-            "list_default_plugins",
-            "Writes a list of default plugins to stdout",
-            default=False,
-            is_flag=True,
+    ),
+    (
+        "Symbol Selection",
+        (
+            Parameter(
+                "symbol_selection_regex",
+                "A regex that is applied to select symbols to be considered for both, the old and the new elf file",
+                default=None,
+            ),
+            Parameter(
+                "symbol_selection_regex_old",
+                "A regex that is applied to select symbols to be considered for the old elf file",
+                default=None,
+            ),
+            Parameter(
+                "symbol_selection_regex_new",
+                "A regex that is applied to select symbols to be considered for the new elf file",
+                default=None,
+            ),
+            Parameter(
+                "symbol_exclusion_regex",
+                "A regex that is applied to select symbols to be excluded for both, the old and the new elf file",
+                default=None,
+            ),
+            Parameter(
+                "symbol_exclusion_regex_old",
+                "A regex that is applied to select symbols to be excluded for the old elf file",
+                default=None,
+            ),
+            Parameter(
+                "symbol_exclusion_regex_new",
+                "A regex that is applied to select symbols to be excluded for the new elf file",
+                default=None,
+            ),
         ),
-    ],
-    "Driver Files": [
-        Parameter(
-            "driver_file",
-            "A yaml file that contains settings and driver information.",
+    ),
+    (
+        "Plugins",
+        (
+            Parameter(
+                "load_plugin",
+                'Loads and parametrizes a plugin. Example: --load_plugin "some/path/to/module.py;PluginClass;foo1=bar2;foo2=bar2"',
+                action="append",
+            ),
+            Parameter(
+                "load_default_plugin",
+                'Loads and parametrizes a default plugin. Example --load_default_plugin "html_export;single_page=False;template_dir=some_directory"',
+                action="append",
+            ),
+            Parameter(
+                "list_default_plugins",
+                "Writes a list of default plugins to stdout",
+                default=False,
+                is_flag=True,
+            ),
         ),
-        Parameter(
-            "driver_template_file",
-            "A yaml file that is generated at the end of the run. It contains default parameters if no report was generated or, otherwise, the parameters that were read.",
+    ),
+    (
+        "Driver Files",
+        (
+            Parameter(
+                "driver_file",
+                "A yaml file that contains settings and driver information.",
+            ),
+            Parameter(
+                "driver_template_file",
+                "A yaml file that is generated at the end of the run. It contains default parameters if no report was generated or, otherwise, the parameters that were read.",
+            ),
         ),
-    ],
-}
+    ),
+)
 
 
 UNGROUPED_PARAMETERS = [
@@ -274,14 +318,38 @@ UNGROUPED_PARAMETERS = [
 ]
 
 PARAMETERS: List[Parameter] = []
-for key, value in GROUPED_PARAMETERS.items():
-    PARAMETERS += value
+for group_name, parameters in GROUPED_PARAMETERS:
+    PARAMETERS += parameters
 
 for parameter in UNGROUPED_PARAMETERS:
     PARAMETERS.append(parameter)
 
+PARAMETERS_BY_NAME: Dict[str, Parameter] = {
+    parameter.name: parameter for parameter in PARAMETERS
+}
+
+# Parameters that are available at the command line
+CMD_LINE_PARAMETERS: Tuple[Parameter, ...] = tuple(
+    parameter for parameter in PARAMETERS if not parameter.no_cmd_line
+)
+
+# Parameters that are stored as members of the Settings class
+MEMBER_PARAMETERS: Tuple[Parameter, ...] = tuple(
+    parameter for parameter in PARAMETERS if not parameter.no_member
+)
+
+# Default values by parameter name, all defaults are immutable and can thus be shared
+CMD_LINE_DEFAULTS: Dict[str, Any] = {
+    parameter.name: parameter.default for parameter in CMD_LINE_PARAMETERS
+}
+MEMBER_DEFAULTS: Dict[str, Any] = {
+    parameter.name: parameter.default for parameter in MEMBER_PARAMETERS
+}
+
 
 class Settings(object):
+    TEMPLATE_FILE_HEADER = "# This is an auto generated elf_diff driver file"
+
     def __init__(self, module_path):
         """Initialize settings class."""
         self.module_path: str = module_path
@@ -330,6 +398,13 @@ class Settings(object):
         self.list_default_plugins: bool
         self.debug: bool
 
+        self.symbol_selection_regex_compiled: Optional[Pattern[str]] = None
+        self.symbol_selection_regex_old_compiled: Optional[Pattern[str]] = None
+        self.symbol_selection_regex_new_compiled: Optional[Pattern[str]] = None
+        self.symbol_exclusion_regex_compiled: Optional[Pattern[str]] = None
+        self.symbol_exclusion_regex_old_compiled: Optional[Pattern[str]] = None
+        self.symbol_exclusion_regex_new_compiled: Optional[Pattern[str]] = None
+
         self.binutils = Binutils()
 
         self._presetDefaults()
@@ -342,7 +417,7 @@ class Settings(object):
         self.old_alias: Optional[str] = None
         self.new_alias: Optional[str] = None
 
-        if hasattr(cmd_line_args, "driver_file"):
+        if cmd_line_args.driver_file:
             self.driver_file = cmd_line_args.driver_file
             self._readDriverFile()
 
@@ -354,9 +429,7 @@ class Settings(object):
         """Preset default values"""
         self.mass_report_members: List[BinaryPairSettings] = []
 
-        for parameter in PARAMETERS:
-            if not parameter.no_member:
-                setattr(self, parameter.name, parameter.default)
+        self.__dict__.update(MEMBER_DEFAULTS)
 
     @staticmethod
     def _addParameterToGroup(
@@ -377,7 +450,7 @@ class Settings(object):
             action = parameter.action or "store"
 
         args_group.add_argument(
-            "--{name}".format(name=param_name),
+            "--" + param_name,
             default=parameter.default,
             dest=parameter.name,
             action=action,
@@ -386,21 +459,23 @@ class Settings(object):
 
         if parameter.deprecated_alias:
             args_group.add_argument(
-                "--{name}".format(name=parameter.deprecated_alias),
+                "--" + parameter.deprecated_alias,
                 default=parameter.default,
                 dest=parameter.name,
                 action=action,
                 help=parameter.description + " (deprecated)",
             )
 
+    # The parser is built only once and must not be modified afterwards
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _prepareParser() -> argparse.ArgumentParser:
         """Prepare the argsparse command line parser and add all arguments to the parser or its args groups"""
         parser = argparse.ArgumentParser(
             description="Compares elf binaries and lists differences in symbol sizes, the disassemblies, etc."
         )
 
-        for group_name, parameters in GROUPED_PARAMETERS.items():
+        for group_name, parameters in GROUPED_PARAMETERS:
             args_group = parser.add_argument_group(group_name)
 
             for parameter in parameters:
@@ -414,13 +489,6 @@ class Settings(object):
 
             Settings._addParameterToGroup(parameter, parser)
 
-        return parser
-
-    @staticmethod
-    def _parseCommandLineArgs() -> object:
-        """Parse command line arguments"""
-        parser = Settings._prepareParser()
-
         parser.add_argument(
             "binaries",
             nargs="*",
@@ -428,27 +496,81 @@ class Settings(object):
             help="The binaries to be compared (this is an alternative to --old_binary_filename and --new_binary_filename)",
         )
 
-        actual_args: List[str] = []
-        for arg_pos in range(1, len(sys.argv)):
-            arg: str = sys.argv[arg_pos]
-            if arg == "--":
-                break
-            actual_args.append(arg)
+        return parser
 
-        return parser.parse_args(actual_args)
+    @staticmethod
+    def _getDefaultCommandLineArgs() -> argparse.Namespace:
+        """Return the arguments that the command line parser yields if no arguments are passed"""
+        return argparse.Namespace(binaries=[], **CMD_LINE_DEFAULTS)
+
+    @staticmethod
+    def _parseCommandLineArgs() -> argparse.Namespace:
+        """Parse command line arguments"""
+        # Arguments following "--" are not meant for elf_diff
+        args_end: int = sys.argv.index("--") if "--" in sys.argv else len(sys.argv)
+        actual_args: List[str] = sys.argv[1:args_end]
+
+        # Driver file based runs usually come without any further arguments.
+        # Those are detected by a minimal parser to save building the full one.
+        pre_parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+        pre_parser.add_argument("--driver_file")
+        pre_args, remaining_args = pre_parser.parse_known_args(actual_args)
+
+        if pre_args.driver_file and (len(remaining_args) == 0):
+            cmd_line_args = Settings._getDefaultCommandLineArgs()
+            cmd_line_args.driver_file = pre_args.driver_file
+            return cmd_line_args
+
+        return Settings._prepareParser().parse_args(actual_args)
+
+    def _loadDriverFile(self) -> Dict:
+        """Load a YAML driver file or its JSON cache if the latter is up to date"""
+        cache_file: str = self.driver_file + ".cache.json"
+
+        if os.path.isfile(cache_file) and (
+            os.stat(cache_file).st_mtime_ns > os.stat(self.driver_file).st_mtime_ns
+        ):
+            with open(cache_file, "r") as f:
+                try:
+                    return json.load(f)
+                except ValueError:
+                    pass  # Corrupt cache, fall back to parsing the YAML file
+
+        # PyYAML is only needed if there is no up to date cache
+        import yaml
+
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader  # type: ignore
 
-    def _readDriverFile(self) -> None:
-        """Read a YAML driver file"""
         my_yaml: Dict
         with open(self.driver_file, "r") as stream:
             try:
-                my_yaml = yaml.load(stream, Loader=yaml.SafeLoader)
+                my_yaml = yaml.load(stream, Loader=SafeLoader)
             except yaml.YAMLError as exc:
                 raise Exception(exc)
 
-        for parameter in PARAMETERS:
-            if (parameter.name in my_yaml.keys()) and (not parameter.no_member):
-                setattr(self, parameter.name, my_yaml[parameter.name])
+        # The cache is optional. Driver files with values that JSON cannot represent
+        # or that live in read-only directories are simply not cached.
+        try:
+            json_str: str = json.dumps(my_yaml)
+            with open(cache_file, "w") as f:
+                f.write(json_str)
+        except (TypeError, ValueError, OSError):
+            pass
+
+        return my_yaml
+
+    def _readDriverFile(self) -> None:
+        """Read a YAML driver file"""
+        my_yaml: Dict = self._loadDriverFile()
+
+        # Keys that are no parameters (e.g. binary_pairs) are handled separately
+        for name, value in my_yaml.items():
+            parameter: Optional[Parameter] = PARAMETERS_BY_NAME.get(name)
+            if (parameter is not None) and (not parameter.no_member):
+                setattr(self, name, value)
 
         # Important: To make self.bin_prefix available all other parameters
         #            must have been read from the yaml file already.
@@ -458,28 +580,21 @@ class Settings(object):
 
         # Read binary pairs
 
-        if "binary_pairs" in my_yaml.keys():
+        if "binary_pairs" in my_yaml:
             bin_pair_id: int = 1
 
             for data_set in my_yaml["binary_pairs"]:
 
-                short_name: str = data_set.get("short_name")
-                if not short_name:
-                    raise Exception(
-                        f"No short_name defined for binary pair {bin_pair_id}"
-                    )
+                # Empty values are treated like missing ones
+                for key in ("short_name", "old_binary", "new_binary"):
+                    if not data_set.get(key):
+                        raise Exception(
+                            f"No {key} defined for binary pair {bin_pair_id}"
+                        )
 
-                old_binary: str = data_set.get("old_binary")
-                if not old_binary:
-                    raise Exception(
-                        f"No old_binary defined for binary pair {bin_pair_id}"
-                    )
-
-                new_binary: str = data_set.get("new_binary")
-                if not new_binary:
-                    raise Exception(
-                        f"No new_binary defined for binary pair {bin_pair_id}"
-                    )
+                short_name: str = data_set["short_name"]
+                old_binary: str = data_set["old_binary"]
+                new_binary: str = data_set["new_binary"]
 
                 bp = BinaryPairSettings(short_name, old_binary, new_binary)
 
@@ -487,23 +602,22 @@ class Settings(object):
 
                 bin_pair_id += 1
 
-    def _considerCommandLineArgs(self, cmd_line_args: Any) -> None:
+    def _considerCommandLineArgs(self, cmd_line_args: argparse.Namespace) -> None:
         """Consider the supplied command line arguments"""
-        for parameter in PARAMETERS:
-            if parameter.no_cmd_line:
-                continue
+        args: Dict[str, Any] = vars(cmd_line_args)
 
-            if hasattr(cmd_line_args, parameter.name):
-                value = getattr(cmd_line_args, parameter.name)
+        for parameter in CMD_LINE_PARAMETERS:
+            if parameter.no_member:
+                continue
 
-                if (value != parameter.default) and (not parameter.no_member):
-                    setattr(self, parameter.name, value)
+            # Missing arguments fall back to the default and are thus ignored
+            value = args.get(parameter.name, parameter.default)
+            if value != parameter.default:
+                setattr(self, parameter.name, value)
 
         # Important: To make self.bin_prefix available the command line arguments for
         #            all other parameters must have been read from the yaml file already.
-        self.binutils.initialize(
-            cmd_line_args.__dict__, bin_prefix=self.bin_prefix, bin_dir=self.bin_dir
-        )
+        self.binutils.initialize(args, bin_prefix=self.bin_prefix, bin_dir=self.bin_dir)
 
         if len(cmd_line_args.binaries) == 0:
             pass
@@ -524,38 +638,27 @@ class Settings(object):
         """Validate and initialize the settings"""
         if self.old_binary_filename and not os.path.isfile(self.old_binary_filename):
             raise Exception(
-                "Old binary '%s' is not a file or cannot be found"
-                % (self.old_binary_filename)
+                f"Old binary '{self.old_binary_filename}' is not a file or cannot be found"
             )
 
         if self.new_binary_filename and not os.path.isfile(self.new_binary_filename):
             raise Exception(
-                "New binary '%s' is not a file or cannot be found"
-                % (self.new_binary_filename)
+                f"New binary '{self.new_binary_filename}' is not a file or cannot be found"
             )
 
-    def _prepareInfoFiles(self) -> None:
-        if self.old_info_file:
-            if os.path.isfile(self.old_info_file):
-                with open(self.old_info_file, "r") as f:
-                    self.old_binary_info = f.read()
-            else:
-                raise Exception(
-                    "Unable to find old info file '%s'" % (self.old_info_file)
-                )
-        else:
-            self.old_binary_info = ""
+    @staticmethod
+    def _readInfoFile(version: str, filename: Optional[str]) -> str:
+        """Read an info file as a whole"""
+        if not filename:
+            return ""
+        if not os.path.isfile(filename):
+            raise Exception(f"Unable to find {version} info file '{filename}'")
+        with open(filename, "r") as f:
+            return f.read()
 
-        if self.new_info_file:
-            if os.path.isfile(self.new_info_file):
-                with open(self.new_info_file, "r") as f:
-                    self.new_binary_info = f.read()
-            else:
-                raise Exception(
-                    "Unable to find new info file '%s'" % (self.new_info_file)
-                )
-        else:
-            self.new_binary_info = ""
+    def _prepareInfoFiles(self) -> None:
+        self.old_binary_info: str = Settings._readInfoFile("old", self.old_info_file)
+        self.new_binary_info: str = Settings._readInfoFile("new", self.new_info_file)
 
     def _prepareAlias(self) -> None:
         if self.old_alias is None:
@@ -564,55 +667,143 @@ class Settings(object):
         if self.new_alias is None:
             self.new_alias = self.new_binary_filename
 
+    @staticmethod
+    def _compileRegex(name: str, regex: Optional[str]) -> Optional[Pattern[str]]:
+        """Compile a regex parameter and report the parameter if the regex is invalid"""
+        if regex is None:
+            return None
+        try:
+            return re.compile(regex)
+        except re.error as e:
+            raise Exception(f"Invalid {name} '{regex}': {e}")
+
+    def _compileSymbolRegexes(self) -> None:
+        """Compile the symbol selection and exclusion regexes once for all binaries
+
+        Empty old and new regexes fall back to the regex that applies to both binaries.
+        """
+        self.symbol_selection_regex_compiled = Settings._compileRegex(
+            "symbol_selection_regex", self.symbol_selection_regex
+        )
+        self.symbol_exclusion_regex_compiled = Settings._compileRegex(
+            "symbol_exclusion_regex", self.symbol_exclusion_regex
+        )
+
+        self.symbol_selection_regex_old_compiled = (
+            Settings._compileRegex(
+                "symbol_selection_regex_old", self.symbol_selection_regex_old
+            )
+            if self.symbol_selection_regex_old
+            else self.symbol_selection_regex_compiled
+        )
+        self.symbol_selection_regex_new_compiled = (
+            Settings._compileRegex(
+                "symbol_selection_regex_new", self.symbol_selection_regex_new
+            )
+            if self.symbol_selection_regex_new
+            else self.symbol_selection_regex_compiled
+        )
+        self.symbol_exclusion_regex_old_compiled = (
+            Settings._compileRegex(
+                "symbol_exclusion_regex_old", self.symbol_exclusion_regex_old
+            )
+            if self.symbol_exclusion_regex_old
+            else self.symbol_exclusion_regex_compiled
+        )
+        self.symbol_exclusion_regex_new_compiled = (
+            Settings._compileRegex(
+                "symbol_exclusion_regex_new", self.symbol_exclusion_regex_new
+            )
+            if self.symbol_exclusion_regex_new
+            else self.symbol_exclusion_regex_compiled
+        )
+
     def _validateAndInitSettings(self) -> None:
         self._validateBinaries()
 
         self._prepareInfoFiles()
         self._prepareAlias()
+        self._compileSymbolRegexes()
+
+    @staticmethod
+    def _getTemplateFileEntry(parameter: Parameter, value: Any) -> str:
+        """Return the template file entry of a parameter"""
+        return f'# {parameter.description}\n#\n{parameter.name}: "{value}"\n\n'
 
     @staticmethod
-    def _writeTemplateFileValue(file_, name: str, value: Any):
-        file_.write("# {desc}\n".format(desc=parameter.description))
-        file_.write("#\n")
-        file_.write('{name}: "{value}"\n'.format(name=parameter.name, value=value))
-        file_.write("\n")
+    def _isTemplateFileUpToDate(filename: str, body: str) -> bool:
+        """Check if a template file exists that differs at most in its generation date"""
+        if not os.path.isfile(filename):
+            return False
+        try:
+            with open(filename, "r") as file_:
+                lines: List[str] = file_.read().split("\n", 2)
+        except (OSError, UnicodeDecodeError):
+            return False
+        return (
+            (len(lines) == 3)
+            and (lines[0] == Settings.TEMPLATE_FILE_HEADER)
+            and (lines[2] == body)
+        )
 
     def writeParameterTemplateFile(
         self, filename: str, output_actual_values: bool = False
     ) -> None:
         """Write a template file with all existing parameters"""
-        with open(filename, "w") as file_:
+        import datetime
+
+        # The whole template is assembled in memory and written at once
+        entries: List[str] = ["\n"]
+
+        for parameter in MEMBER_PARAMETERS:
+
+            if output_actual_values:
+                value = getattr(self, parameter.name)
+                if not value:
+                    value = parameter.default
+
+            else:
+                value = parameter.default
+
+            entries.append(Settings._getTemplateFileEntry(parameter, value))
 
-            file_.write("# This is an auto generated elf_diff driver file\n")
-            file_.write(
-                "# Generated by elf_diff {date}\n".format(
-                    date=datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                )
+        for command in Binutils.COMMANDS:
+            name = f"{command}_command"
+            value = getattr(self.binutils, name)
+
+            entries.append(
+                Settings._getTemplateFileEntry(PARAMETERS_BY_NAME[name], value)
             )
-            file_.write("\n")
 
-            for parameter in PARAMETERS:
+        body: str = "".join(entries)
 
-                if parameter.no_member:
-                    continue
+        # Leave the file untouched if only the generation date would change
+        if Settings._isTemplateFileUpToDate(filename, body):
+            return
 
-                if output_actual_values:
-                    value = getattr(self, parameter.name)
-                    if not value:
-                        value = parameter.default
+        date: str = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-                else:
-                    value = parameter.default
+        # Replace the file atomically to never leave a partially written template.
+        # Symlinks are resolved so that their target is replaced instead of the link.
+        target: str = os.path.realpath(filename)
+        tmp_filename: str = f"{target}.{uuid.uuid4().hex}.tmp"
 
-                Settings._writeTemplateFileValue(
-                    file_=file_, name=parameter.name, value=value
-                )
+        # Like open(..., "w"), new files are created with the permissions implied by the umask
+        fd: int = os.open(tmp_filename, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with open(fd, "w") as f:
+                f.write(f"{Settings.TEMPLATE_FILE_HEADER}\n")
+                f.write(f"# Generated by elf_diff {date}\n")
+                f.write(body)
 
-            for command in Binutils.COMMANDS:
-                name = "%s_command" % command
-                value = getattr(self.binutils, name)
+            # Keep the permissions of an existing template
+            if os.path.exists(target):
+                os.chmod(tmp_filename, stat.S_IMODE(os.stat(target).st_mode))
 
-                Settings._writeTemplateFileValue(file_=file_, name=name, value=value)
+            os.replace(tmp_filename, target)
+        finally:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
 
     def isFirmwareBinaryDefined(self) -> bool:
         """Check if any firmware binary is defined"""
@@ -18,36 +18,28 @@
 # You should have received a copy of the GNU General Public License along with along with
 # this program. If not, see <http://www.gnu.org/licenses/>.
 #
-from typing import Optional
-import re
+from typing import Optional, Pattern
 
 
 class SymbolSelection(object):
     def __init__(
         self,
-        symbol_selection_regex: Optional[str],
-        symbol_exclusion_regex: Optional[str],
+        symbol_selection_regex: Optional[Pattern[str]],
+        symbol_exclusion_regex: Optional[Pattern[str]],
     ):
-        self.symbol_selection_regex: Optional[str] = symbol_selection_regex
-        self.symbol_selection_regex_compiled = None
-        if symbol_selection_regex is not None:
-            self.symbol_selection_regex_compiled = re.compile(symbol_selection_regex)
-
-        self.symbol_exclusion_regex: Optional[str] = symbol_exclusion_regex
-        self.symbol_exclusion_regex_compiled = None
-        if symbol_exclusion_regex is not None:
-            self.symbol_exclusion_regex_compiled = re.compile(symbol_exclusion_regex)
+        self.symbol_selection_regex: Optional[Pattern[str]] = symbol_selection_regex
+        self.symbol_exclusion_regex: Optional[Pattern[str]] = symbol_exclusion_regex
 
     def isSymbolSelected(self, symbol_name: str) -> bool:
         """Check if a symbol is selected via a regex"""
-        if self.symbol_exclusion_regex_compiled is not None:
-            if re.match(self.symbol_exclusion_regex_compiled, symbol_name):
+        if self.symbol_exclusion_regex is not None:
+            if self.symbol_exclusion_regex.match(symbol_name):
                 return False
 
-        if self.symbol_selection_regex_compiled is None:
+        if self.symbol_selection_regex is None:
             return True
 
-        if re.match(self.symbol_selection_regex_compiled, symbol_name):
+        if self.symbol_selection_regex.match(symbol_name):
             return True
 
         return False
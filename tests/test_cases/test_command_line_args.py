@@ -24,8 +24,12 @@ from elf_diff_test.test_binaries import getTestBinary
 from elf_diff_test.args_watcher import ElfDiffCommandLineArgsWatcher, ArgsList
 from elf_diff_test.test_binaries import TESTING_DIR
 
-from elf_diff.__main__ import RETURN_CODE_WARNINGS_OCCURRED
+from elf_diff.__main__ import (
+    RETURN_CODE_WARNINGS_OCCURRED,
+    RETURN_CODE_UNRECOVERABLE_ERROR,
+)
 
+import json
 import os
 import unittest
 from typing import Optional
@@ -132,11 +136,92 @@ class TestCommandLineArgs(ElfDiffExecutionMixin, TestCaseWithSubdirs):
         self.assertTrue(os.path.isfile(html_file))
         self.assertTrue(os.path.isfile(template_file))
 
+    def test_driver_file_cache(self):
+
+        elf_diff_test_yaml_file = "cached_pair_report.elf_diff_test.yml"
+        cache_file = elf_diff_test_yaml_file + ".cache.json"
+        yaml_html_file = "yaml_pair_report_output.html"
+        cached_html_file = "cached_pair_report_output.html"
+
+        old_binary_filename = getTestBinary("x86_64", "test", "release", "old")
+        new_binary_filename = getTestBinary("x86_64", "test", "release", "new")
+
+        with open(elf_diff_test_yaml_file, "w") as f:
+            f.write("old_binary_filename: '" + old_binary_filename + "'\n")
+            f.write("new_binary_filename: '" + new_binary_filename + "'\n")
+            f.write("html_file: '" + yaml_html_file + "'\n")
+
+        def setYamlFileAge(seconds: int) -> None:
+            """Make the YAML file older (positive) or newer (negative) than the cache"""
+            cache_mtime: int = os.stat(cache_file).st_mtime_ns
+            yaml_mtime: int = cache_mtime - seconds * 1000000000
+            os.utime(elf_diff_test_yaml_file, ns=(yaml_mtime, yaml_mtime))
+
+        def removeOutput() -> None:
+            for html_file in [yaml_html_file, cached_html_file]:
+                if os.path.isfile(html_file):
+                    os.remove(html_file)
+
+        # The first run generates the cache
+        #
+        self.runElfDiff(args=[("driver_file", elf_diff_test_yaml_file)])
+        self.assertTrue(os.path.isfile(yaml_html_file))
+        with open(cache_file, "r") as f:
+            self.assertEqual(json.load(f)["html_file"], yaml_html_file)
+
+        # An up to date cache is read instead of the YAML file
+        #
+        with open(cache_file, "w") as f:
+            json.dump(
+                {
+                    "old_binary_filename": old_binary_filename,
+                    "new_binary_filename": new_binary_filename,
+                    "html_file": cached_html_file,
+                },
+                f,
+            )
+        setYamlFileAge(10)
+        removeOutput()
+        self.runElfDiff(args=[("driver_file", elf_diff_test_yaml_file)])
+        self.assertTrue(os.path.isfile(cached_html_file))
+        self.assertFalse(os.path.isfile(yaml_html_file))
+
+        # A YAML file that is newer than the cache wins and the cache is rewritten
+        #
+        setYamlFileAge(-10)
+        removeOutput()
+        self.runElfDiff(args=[("driver_file", elf_diff_test_yaml_file)])
+        self.assertTrue(os.path.isfile(yaml_html_file))
+        self.assertFalse(os.path.isfile(cached_html_file))
+        with open(cache_file, "r") as f:
+            self.assertEqual(json.load(f)["html_file"], yaml_html_file)
+
+        # A corrupt cache falls back to the YAML file
+        #
+        with open(cache_file, "w") as f:
+            f.write("{ this is no json")
+        setYamlFileAge(10)
+        removeOutput()
+        self.runElfDiff(args=[("driver_file", elf_diff_test_yaml_file)])
+        self.assertTrue(os.path.isfile(yaml_html_file))
+        with open(cache_file, "r") as f:
+            self.assertEqual(json.load(f)["html_file"], yaml_html_file)
+
     def test_driver_template_file(self):
         driver_template_file = "elf_diff_test_template.yml"
         self.runSimpleTest([("driver_template_file", driver_template_file)])
         self.assertTrue(os.path.isfile(driver_template_file))
 
+        with open(driver_template_file, "r") as f:
+            template: str = f.read()
+        self.assertTrue('html_file: "single_page_report.html"' in template)
+        self.assertTrue('size_command: "' in template)
+
+        # An unchanged template is not rewritten
+        mtime: int = os.stat(driver_template_file).st_mtime_ns
+        self.runSimpleTest([("driver_template_file", driver_template_file)])
+        self.assertTrue(os.stat(driver_template_file).st_mtime_ns == mtime)
+
     def test_dump_document_structure(self):
         self.runSimpleTest([("dump_document_structure", None)])
 
@@ -286,6 +371,30 @@ class TestCommandLineArgs(ElfDiffExecutionMixin, TestCaseWithSubdirs):
         self.assertTrue(os.path.isfile(html_file))
         self.assertTrue(os.path.isfile(template_file))
 
+    def test_mass_report_empty_binary_pair_value(self):
+
+        elf_diff_test_yaml_file = "empty_value_mass_report.elf_diff_test.yml"
+
+        with open(elf_diff_test_yaml_file, "w") as f:
+            f.write("html_file: 'empty_value_mass_report_output.html'\n")
+            f.write("binary_pairs:\n")
+            f.write(
+                "    - old_binary: '"
+                + getTestBinary("x86_64", "test", "release", "old")
+                + "'\n"
+            )
+            f.write(
+                "      new_binary: '"
+                + getTestBinary("x86_64", "test", "release", "new")
+                + "'\n"
+            )
+            f.write("      short_name: ''\n")
+
+        self.runElfDiff(
+            args=[("driver_file", elf_diff_test_yaml_file)],
+            expected_return_code=RETURN_CODE_UNRECOVERABLE_ERROR,
+        )
+
     def test_mass_report1(self):
         self._testMassReport()
 